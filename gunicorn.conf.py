@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration
+
+Loaded automatically by gunicorn from the working directory. Every setting
+can be overridden from the environment or the command line.
+"""
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8080")
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+
+# The handlers spend most of their time waiting on Postgres, so the gevent
+# worker serves many requests per process. It monkey-patches the worker
+# before the app is loaded, and psycopg then waits on sockets cooperatively.
+# Greenlets beyond the SQLAlchemy pool (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+# queue for a connection instead of opening more.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+# Only used by the gthread worker (GUNICORN_WORKER_CLASS=gthread)
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
@@ -23,6 +23,7 @@ and SQL database
 from flask import Flask
 from service import config
 from service.common import log_handlers
+from service.common.json_response import OrjsonProvider
 
 
 def create_app():
@@ -30,12 +31,13 @@ def create_app():
     # pylint: disable=import-outside-toplevel
 
     flask_app = Flask(__name__)
+    flask_app.json = OrjsonProvider(flask_app)
     flask_app.config.from_object(config)
 
     flask_app.url_map.strict_slashes = False
 
     # ---- Database setup ----
-    from service.models import db
+    from service.models import db, upgrade_indexes
     db.init_app(flask_app)
 
     with flask_app.app_context():
@@ -44,10 +46,18 @@ def create_app():
 
         try:
             db.create_all()
+            with db.engine.begin() as connection:
+                upgrade_indexes(connection)
         except Exception as error:  # pylint: disable=broad-exception-caught  # pragma: no cover
             flask_app.logger.warning("%s: Database not ready yet", error)  # pragma: no cover
 
         log_handlers.init_logging(flask_app, "gunicorn.error")
+        from service.common import cli_commands
+        cli_commands.init_cli(flask_app)
+
+        if flask_app.config["EXPIRE_JOB"]:
+            from service.common.background import start_expiry_job
+            start_expiry_job(flask_app)
 
         flask_app.logger.info(70 * "*")
         flask_app.logger.info("PROMOTION SERVICE RUNNING".center(70, "*"))
@@ -0,0 +1,58 @@
+######################################################################
+# Copyright 2016, 2024 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+"""
+Background Jobs
+
+Periodic maintenance that runs beside the request handlers
+"""
+import atexit
+import threading
+
+
+def run_periodically(app, interval: float, job):
+    """Call job() every interval seconds inside an app context, on a daemon thread
+
+    Returns the Event that stops the thread; it is also set at interpreter exit.
+    """
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            with app.app_context():
+                try:
+                    job()
+                except Exception:  # pylint: disable=broad-exception-caught
+                    app.logger.exception("Background job %s failed", job.__name__)
+
+    threading.Thread(target=loop, name=f"periodic-{job.__name__}", daemon=True).start()
+    atexit.register(stop.set)
+    return stop
+
+
+def start_expiry_job(app):
+    """Expire overdue promotions every EXPIRE_INTERVAL seconds (0 disables the job)
+
+    create_app() starts it when EXPIRE_JOB is set; see service/config.py for
+    why that should be a single process.
+    """
+    from service.models import Promotion  # pylint: disable=import-outside-toplevel
+
+    interval = app.config["EXPIRE_INTERVAL"]
+    if interval <= 0:
+        return None
+    app.logger.info("Expiring overdue promotions every %s seconds", interval)
+    return run_periodically(app, interval, Promotion.expire_overdue)
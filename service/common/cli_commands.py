@@ -18,7 +18,7 @@ Flask CLI Command Extensions
 """
 import click
 from flask.cli import with_appcontext
-from service.models import db
+from service.models import db, Promotion
 
 
 ######################################################################
@@ -46,6 +46,17 @@ def db_drop():
     click.echo("All tables dropped successfully!")
 
 
+######################################################################
+# Command to expire overdue promotions
+######################################################################
+@click.command("expire-promotions")
+@with_appcontext
+def expire_promotions():
+    """Marks overdue active promotions as expired, once"""
+    expired = Promotion.expire_overdue()
+    click.echo(f"Expired {expired} promotions")
+
+
 ######################################################################
 # CLI registration helper
 ######################################################################
@@ -53,3 +64,4 @@ def init_cli(app):
     """Registers Flask CLI commands with the app"""
     app.cli.add_command(db_create)
     app.cli.add_command(db_drop)
+    app.cli.add_command(expire_promotions)
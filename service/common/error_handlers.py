@@ -16,10 +16,10 @@
 """
 Module: error_handlers
 """
-from flask import jsonify
 from flask import current_app as app  # Import Flask application
 from service.models import DataValidationError
 from . import status
+from .json_response import json_response
 
 
 ######################################################################
@@ -37,7 +37,7 @@ def bad_request(error):
     message = str(error)
     app.logger.warning(message)
     return (
-        jsonify(error="Bad Request", message=message),
+        json_response({"error": "Bad Request", "message": message}),
         status.HTTP_400_BAD_REQUEST,
     )
 
@@ -48,7 +48,7 @@ def not_found(error):
     message = str(error)
     app.logger.warning(message)
     return (
-        jsonify(error="Not Found", message=message),
+        json_response({"error": "Not Found", "message": message}),
         status.HTTP_404_NOT_FOUND,
     )
 
@@ -59,7 +59,7 @@ def method_not_supported(error):
     message = str(error)
     app.logger.warning(message)
     return (
-        jsonify(error="Method not Allowed", message=message),
+        json_response({"error": "Method not Allowed", "message": message}),
         status.HTTP_405_METHOD_NOT_ALLOWED,
     )
 
@@ -70,7 +70,7 @@ def mediatype_not_supported(error):
     message = str(error)
     app.logger.warning(message)
     return (
-        jsonify(error="Unsupported media type", message=message),
+        json_response({"error": "Unsupported media type", "message": message}),
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
     )
 
@@ -81,7 +81,7 @@ def internal_server_error(error):
     message = str(error)
     app.logger.error(message)
     return (
-        jsonify(error="Internal Server Error", message=message),
+        json_response({"error": "Internal Server Error", "message": message}),
         status.HTTP_500_INTERNAL_SERVER_ERROR,
     )
 
@@ -0,0 +1,43 @@
+######################################################################
+# Copyright 2016, 2024 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+"""
+JSON Responses
+
+Builds JSON responses, and parses JSON requests, with orjson instead of the
+stdlib json module
+"""
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from . import status
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by request.get_json()"""
+
+    def loads(self, s, **kwargs):
+        """Parse JSON text or bytes"""
+        return orjson.loads(s)
+
+    def dumps(self, obj, **kwargs):
+        """Serialize to a JSON string, falling back to Flask's default() for unknown types"""
+        option = orjson.OPT_SORT_KEYS if kwargs.get("sort_keys", self.sort_keys) else 0
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+
+
+def json_response(data, code=status.HTTP_200_OK, headers=None):
+    """Return data encoded as an application/json Response"""
+    return Response(orjson.dumps(data), status=code, headers=headers, mimetype="application/json")
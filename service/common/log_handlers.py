@@ -20,11 +20,37 @@ Log Handlers
 This module contains utility functions to set up logging
 consistently
 """
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Logger used by the models and routes on the request path
+REQUEST_LOGGER = "flask.app"
+
+# The listener started by the latest init_app(); there is never more than one
+_listener = None
+
+
+def stop_listener():
+    """Write out the queued records and stop the listener thread, if one is running"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_listener)
 
 
 def init_app(app):
-    """Basic logging for development and testing"""
+    """Basic logging for development and testing
+
+    Request threads only enqueue records; a single QueueListener thread
+    formats them and writes them out. Calling it again, e.g. for another
+    create_app(), replaces the previous listener instead of adding one.
+    """
+    global _listener
     handler = logging.StreamHandler()
     handler.setLevel(logging.INFO)
     formatter = logging.Formatter(
@@ -32,10 +58,17 @@ def init_app(app):
     )
     handler.setFormatter(formatter)
 
-    if not app.logger.handlers:
-        app.logger.addHandler(handler)
+    stop_listener()
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    request_logger = logging.getLogger(REQUEST_LOGGER)
+    for logger in (app.logger, request_logger):
+        logger.handlers = [QueueHandler(log_queue)]
 
     app.logger.setLevel(logging.INFO)
+    request_logger.setLevel(app.config.get("LOGGING_LEVEL", logging.INFO))
     app.logger.info("Logging initialized")
 
 
@@ -0,0 +1,40 @@
+######################################################################
+# Copyright 2016, 2024 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+"""
+MessagePack Responses
+
+Builds application/msgpack responses for clients that ask for them
+"""
+from datetime import datetime
+import msgpack
+from flask import Response
+from . import status
+
+MSGPACK_MIMETYPE = "application/msgpack"
+
+
+def _default(value):
+    """Encode datetimes as the same ISO 8601 strings the JSON responses use"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__} to MessagePack")
+
+
+def msgpack_response(data, code=status.HTTP_200_OK, headers=None):
+    """Return data encoded as an application/msgpack Response"""
+    return Response(
+        msgpack.packb(data, default=_default), status=code, headers=headers, mimetype=MSGPACK_MIMETYPE
+    )
@@ -2,7 +2,6 @@
 Global Configuration for Application
 """
 import os
-import logging
 
 # ---------------------------------------------------------------------
 # Database Configuration
@@ -15,8 +14,33 @@ DATABASE_URI = os.getenv(
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# Keep warm connections for every worker thread and drop stale ones before use.
+# pool_size + max_overflow caps the concurrent queries of one gunicorn worker;
+# greenlets beyond it wait for a connection. Size it so that
+# GUNICORN_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays below Postgres'
+# max_connections (100 by default).
+SQLALCHEMY_ENGINE_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "30")),
+    "pool_pre_ping": True,
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+}
+
+# Run the job that marks overdue active promotions as expired inside this
+# process, every EXPIRE_INTERVAL seconds (0 disables it). Every process that
+# enables it sweeps on its own, so enable it in a single one: the dev server
+# (.flaskenv) or honcho with one gunicorn worker. Kubernetes leaves it off in
+# the web pods and runs `flask expire-promotions` from a CronJob instead.
+EXPIRE_JOB = os.getenv("EXPIRE_JOB", "False").lower() in ("true", "1", "yes")
+EXPIRE_INTERVAL = float(os.getenv("EXPIRE_INTERVAL", "60"))
+
+# Seconds clients may reuse a list response before revalidating it with If-None-Match
+LIST_MAX_AGE = int(os.getenv("LIST_MAX_AGE", "10"))
+
 # ---------------------------------------------------------------------
 # Security & Logging
 # ---------------------------------------------------------------------
 SECRET_KEY = os.getenv("SECRET_KEY", "sup3r-s3cr3t")
-LOGGING_LEVEL = logging.INFO
+# Level of the request-path logger. INFO suits development; production runs
+# WARNING (k8s/deployment.yaml) so the per-request INFO records are skipped
+LOGGING_LEVEL = os.getenv("LOGGING_LEVEL", "INFO")
@@ -4,17 +4,54 @@ Models for YourResourceModel
 All of the models are stored in this module
 """
 
+import itertools
 import logging
+import time
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import CheckConstraint, Index, Enum as SQLEnum, func
+from sqlalchemy import (
+    CheckConstraint, Index, Enum as SQLEnum, cast, event, func, insert, inspect, select, text, update
+)
+from sqlalchemy.orm import raiseload
+from sqlalchemy.schema import CreateIndex
 logger = logging.getLogger("flask.app")
 
 # Create the SQLAlchemy object to be initialized later in init_db()
 db = SQLAlchemy()
 
+REQUIRED_FIELDS = ("product_name", "original_price", "promotion_type", "expiration_date")
+NUMERIC_TYPES = (int, float, Decimal)
+# Scale of the Numeric(10, 2) price columns, and the digits left before the point
+CENTS = Decimal("0.01")
+PRICE_DIGITS = 8
+
+# Columns copied by duplicate_promotion; id and timestamps are generated by the database
+DUPLICATE_COLUMNS = (
+    "product_name", "description", "original_price", "discount_value", "discount_type",
+    "promotion_type", "start_date", "expiration_date", "status",
+)
+
+# Suffixes for the names of duplicated promotions: strictly increasing within a
+# process, and seeded from the clock in nanoseconds so processes do not collide
+COPY_NUMBERS = itertools.count(time.time_ns())
+
+# Rows expire_overdue() claims and commits at a time
+EXPIRE_BATCH_SIZE = 500
+
+# Columns searched with ILIKE '%keyword%' by the list endpoint
+TRIGRAM_COLUMNS = ("product_name", "description")
+
+# Indexes dropped from Promotion.__table_args__ that older databases may still have;
+# ix_promotions_status is served by the status-led composite indexes
+OBSOLETE_INDEXES = ("ix_promotions_status",)
+
+# Columns each computed field of serialize_row() is derived from
+DERIVED_FIELD_COLUMNS = {
+    "discounted_price": ("original_price", "discount_value", "discount_type", "promotion_type"),
+}
+
 
 class DataValidationError(Exception):
     """Used for an data validation errors when deserializing"""
@@ -45,7 +82,61 @@ class StatusEnum(str, Enum):
     deleted = "deleted"  # pylint: disable=invalid-name
 
 
-class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes
+def _string(value):
+    """Accept a string (or None) override value"""
+    if value is not None and not isinstance(value, str):
+        raise TypeError(f"expected string, got {type(value).__name__}")
+    return value
+
+
+def _numeric(value):
+    """Accept a numeric (or None) override value"""
+    if value is not None and not isinstance(value, NUMERIC_TYPES):
+        raise TypeError(f"expected numeric, got {type(value).__name__}")
+    return _price(value)
+
+
+def _as_decimal(value):
+    """Return value as a Decimal, converting floats through their shortest repr"""
+    # Decimal(0.9) would carry the float's full binary expansion (50+ digits)
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _price(value):
+    """Return a price rounded as the Numeric(10, 2) columns store it, or None"""
+    # The write endpoints answer from the objects they wrote, so those must
+    # hold what a read would return, not the float the request carried
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise TypeError("expected numeric, got bool")
+    value = _as_decimal(value)
+    # Out of range values would make quantize() raise InvalidOperation
+    if not value.is_finite() or value.adjusted() >= PRICE_DIGITS:
+        raise ValueError(f"{value} is not a price")
+    return value.quantize(CENTS, rounding=ROUND_HALF_UP)
+
+
+def _json_value(value):
+    """Convert a column value the way serialize_row() does"""
+    return float(value) if isinstance(value, Decimal) else value
+
+
+# Validation/conversion applied to each field a duplicate request may override
+DUPLICATE_CONVERTERS = {
+    "product_name": _string,
+    "description": _string,
+    "original_price": _numeric,
+    "discount_value": _numeric,
+    "discount_type": lambda value: DiscountTypeEnum(value) if value else None,
+    "promotion_type": PromotionTypeEnum,
+    "start_date": lambda value: datetime.fromisoformat(value) if value else None,
+    "expiration_date": datetime.fromisoformat,
+    "status": lambda value: StatusEnum(value) if value else StatusEnum.draft,
+}
+
+
+class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Promotion model for managing promotional offers"""
     __tablename__ = "promotions"
 
@@ -61,21 +152,29 @@ class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes
     status = db.Column(SQLEnum(StatusEnum), nullable=False, default=StatusEnum.draft)
     # pylint: disable=not-callable
     created_at = db.Column(db.DateTime, nullable=False, server_default=func.now())
+    # statement_timestamp() rather than now(), which is fixed for the whole
+    # transaction, so every UPDATE moves updated_at and the ETags built on it
     # pylint: disable=not-callable
     updated_at = db.Column(
-        db.DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+        db.DateTime, nullable=False, server_default=func.now(), onupdate=func.statement_timestamp()
     )
 
     @property
     def discounted_price(self):
         """Calculate the discounted price based on discount type and value"""
-        if self.promotion_type != PromotionTypeEnum.discount or not self.discount_value:
-            return self.original_price
-        if self.discount_type == DiscountTypeEnum.amount:
-            return max(self.original_price - self.discount_value, 0)
-        if self.discount_type == DiscountTypeEnum.percent:
-            return max(Decimal(self.original_price) * Decimal(1 - self.discount_value / 100), 0)
-        return self.original_price
+        return self.price_after_discount(self)
+
+    @staticmethod
+    def price_after_discount(row):
+        """Calculate the discounted price of a Promotion or a promotions table row"""
+        if row.promotion_type != PromotionTypeEnum.discount or not row.discount_value:
+            return row.original_price
+        if row.discount_type == DiscountTypeEnum.amount:
+            return max(row.original_price - row.discount_value, 0)
+        if row.discount_type == DiscountTypeEnum.percent:
+            factor = (100 - _as_decimal(row.discount_value)) / 100
+            return max(_as_decimal(row.original_price) * factor, 0)
+        return row.original_price
 
     def create(self):
         """Create a new promotion in the database"""
@@ -110,21 +209,47 @@ class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes
             raise DataValidationError(e) from e
 
     def serialize(self):
-        """Serializes a Promotion into a JSON-friendly dictionary"""
+        """Serializes a Promotion into a dictionary for orjson"""
+        return self.serialize_row(self)
+
+    @classmethod
+    def serialize_row(cls, row):
+        """Serializes a Promotion or a promotions table row into a dictionary for orjson
+
+        orjson encodes enums by value and datetimes in ISO 8601 natively, so
+        only the Decimal columns need converting here.
+        """
+        return {
+            "id": row.id,
+            "product_name": row.product_name,
+            "description": row.description,
+            "original_price": float(row.original_price),
+            "discount_value": float(row.discount_value) if row.discount_value is not None else None,
+            "discount_type": row.discount_type,
+            "promotion_type": row.promotion_type,
+            "start_date": row.start_date,
+            "expiration_date": row.expiration_date,
+            "status": row.status,
+            "discounted_price": float(cls.price_after_discount(row)),
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+        }
+
+    @classmethod
+    def projection(cls, fields):
+        """Return the columns needed to serialize the given fields (id is always included)"""
+        names = {"id"}
+        for field in fields:
+            names.update(DERIVED_FIELD_COLUMNS.get(field, (field,)))
+        return [cls.__table__.c[name] for name in sorted(names)]
+
+    @classmethod
+    def serialize_fields(cls, row, fields):
+        """Serializes only the given fields of a Promotion or a promotions table row"""
         return {
-            "id": self.id,
-            "product_name": self.product_name,
-            "description": self.description,
-            "original_price": float(self.original_price),
-            "discount_value": float(self.discount_value) if self.discount_value is not None else None,
-            "discount_type": self.discount_type.value if self.discount_type else None,
-            "promotion_type": self.promotion_type.value,
-            "start_date": self.start_date.isoformat() if self.start_date else None,
-            "expiration_date": self.expiration_date.isoformat(),
-            "status": self.status.value,
-            "discounted_price": float(self.discounted_price),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            field: float(cls.price_after_discount(row)) if field == "discounted_price"
+            else _json_value(getattr(row, field))
+            for field in fields
         }
 
     def deserialize(self, data):  # noqa: C901
@@ -135,31 +260,40 @@ class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes
             data (dict): A dictionary containing the promotion data
         """
         try:
-            required_fields = ["product_name", "original_price", "promotion_type", "expiration_date"]
-            for field in required_fields:
+            for field in REQUIRED_FIELDS:
                 if field not in data:
                     raise DataValidationError(f"Missing required field: {field}")
-            if not isinstance(data["product_name"], str):
+            # Read every field once and validate/convert from the locals
+            product_name = data["product_name"]
+            description = data.get("description")
+            original_price = data["original_price"]
+            discount_value = data.get("discount_value")
+            discount_type = data.get("discount_type")
+            promotion_type = data["promotion_type"]
+            start_date = data.get("start_date")
+            status = data.get("status")
+            if not isinstance(product_name, str):
                 raise DataValidationError("Invalid data type for 'product_name'; expected string")
-            if not isinstance(data["original_price"], (int, float, Decimal)):
+            if not isinstance(original_price, NUMERIC_TYPES):
                 raise DataValidationError("Invalid data type for 'original_price'; expected numeric")
-            if data.get("discount_value") is not None and not isinstance(data["discount_value"], (int, float, Decimal)):
+            if discount_value is not None and not isinstance(discount_value, NUMERIC_TYPES):
                 raise DataValidationError("Invalid data type for 'discount_value'; expected numeric")
-            if data.get("description") and not isinstance(data["description"], str):
+            if description and not isinstance(description, str):
                 raise DataValidationError("Invalid data type for 'description'; expected string")
-            if data.get("promotion_type") == PromotionTypeEnum.other and data.get("discount_value") is not None:
-                raise DataValidationError("the discount_value should be None")
-            if data.get("promotion_type") == PromotionTypeEnum.other and data.get("discount_type") is not None:
-                raise DataValidationError("the discount_type should be None")
-            self.product_name = data["product_name"]
-            self.description = data.get("description")
-            self.original_price = data["original_price"]
-            self.discount_value = data.get("discount_value")
-            self.discount_type = DiscountTypeEnum(data["discount_type"]) if data.get("discount_type") else None
-            self.promotion_type = PromotionTypeEnum(data["promotion_type"]) if data.get("promotion_type") else None
-            self.start_date = datetime.fromisoformat(data["start_date"]) if data.get("start_date") else datetime.now()
+            if promotion_type == PromotionTypeEnum.other:
+                if discount_value is not None:
+                    raise DataValidationError("the discount_value should be None")
+                if discount_type is not None:
+                    raise DataValidationError("the discount_type should be None")
+            self.product_name = product_name
+            self.description = description
+            self.original_price = _price(original_price)
+            self.discount_value = _price(discount_value)
+            self.discount_type = DiscountTypeEnum(discount_type) if discount_type else None
+            self.promotion_type = PromotionTypeEnum(promotion_type) if promotion_type else None
+            self.start_date = datetime.fromisoformat(start_date) if start_date else datetime.now()
             self.expiration_date = datetime.fromisoformat(data["expiration_date"])
-            self.status = StatusEnum(data["status"]) if data.get("status") else StatusEnum.draft
+            self.status = StatusEnum(status) if status else StatusEnum.draft
 
         except KeyError as error:
             raise DataValidationError(f"Missing required field: {error.args[0]}") from error
@@ -169,8 +303,17 @@ class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes
             raise DataValidationError(f"Invalid input data type: {error}") from error
         return self
 
+    # Fetch created_at/updated_at with RETURNING on INSERT and UPDATE instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
-        Index("ix_promotions_status", "status"),
+        # The list filters: role (status) plus the date range, and role plus keyset on id;
+        # both also serve status-only lookups through their leading column
+        Index("ix_promotions_status_dates", "status", "start_date", "expiration_date"),
+        Index("ix_promotions_status_id", "status", "id"),
+        # The expiry sweep: status = 'active' AND expiration_date < now. Like the
+        # others, upgrade_indexes() adds it to tables created before it existed
+        Index("ix_promotions_status_expiration", "status", "expiration_date"),
         Index("ix_promotions_expiration_date", "expiration_date"),
         Index("ix_promotions_name", "product_name"),
         Index("ix_promotions_type", "promotion_type"),
@@ -197,97 +340,186 @@ class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes
     def all(cls):
         """return all the Promotion fields"""
         logger.info("Processing all YourResourceModels")
-        return cls.query.all()
+        return db.session.scalars(select(cls)).all()
+
+    @classmethod
+    def expire_overdue(cls, batch_size=EXPIRE_BATCH_SIZE):
+        """Mark every active promotion past its expiration date as expired
+
+        Rows are claimed in batches with FOR UPDATE SKIP LOCKED and each batch
+        is committed on its own, so the sweep never waits on (or holds) row
+        locks for long and two sweeps never block each other.
+        Returns the number of promotions that were expired.
+        """
+        now = datetime.now()
+        claimed = (
+            select(cls.id)
+            .where(cls.expiration_date < now, cls.status == StatusEnum.active)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(cls)
+            .where(cls.id.in_(claimed.scalar_subquery()))
+            .values(status=StatusEnum.expired)
+            .execution_options(synchronize_session="fetch")
+        )
+        expired = 0
+        try:
+            while True:
+                count = db.session.execute(stmt).rowcount
+                # Nothing left to expire; end the transaction rather than
+                # hold the lock the empty UPDATE took on promotions_version
+                if not count:
+                    db.session.rollback()
+                    break
+                db.session.commit()
+                expired += count
+                if count < batch_size:
+                    break
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error expiring overdue promotions")
+            raise DataValidationError(e) from e
+        return expired
+
+    @classmethod
+    def table_version(cls):
+        """Return the number of committed statements that changed the table
+
+        It moves with every commit that writes to promotions, however the
+        write was made; see create_version_trigger().
+        """
+        return db.session.execute(select(promotions_version.c.version)).scalar()
 
     @classmethod
     def find(cls, by_id):
         """Finds a YourResourceModel by it's ID"""
         logger.info("Processing lookup for id %s ...", by_id)
-        return cls.query.session.get(cls, by_id)
+        # Only scalar columns are ever needed, so any lazy load is a bug
+        return db.session.get(cls, by_id, options=[raiseload("*")])
+
+    @classmethod
+    def find_updated_at(cls, by_id):
+        """Return only the updated_at of the Promotion with the given id, or None"""
+        return db.session.execute(select(cls.updated_at).where(cls.id == by_id)).scalar()
 
     @classmethod
     def find_by_name(cls, name):
         """Find Promotions by product_name."""
-        return cls.query.filter_by(product_name=name).all()
+        return db.session.scalars(select(cls).filter_by(product_name=name)).all()
 
     @classmethod
     def find_by_status(cls, status):
-        """Find Promotions by product_name."""
-        return cls.query.filter_by(status=status).all()
+        """Find Promotions by status."""
+        return db.session.scalars(select(cls).filter_by(status=status)).all()
 
     @classmethod
     def find_by_discount_type(cls, discount_type):
-        """Find Promotions by product_name."""
-        return cls.query.filter_by(discount_type=discount_type).all()
+        """Find Promotions by discount_type."""
+        return db.session.scalars(select(cls).filter_by(discount_type=discount_type)).all()
 
     @classmethod
     def find_by_expiration_date(cls, expiration_date):
-        """Find Promotions by product_name."""
-        return cls.query.filter_by(expiration_date=expiration_date).all()
+        """Find Promotions by expiration_date."""
+        return db.session.scalars(select(cls).filter_by(expiration_date=expiration_date)).all()
 
     @classmethod
     def find_by_promotion_type(cls, promotion_type):
-        """Find Promotions by product_name."""
-        return cls.query.filter_by(promotion_type=promotion_type).all()
+        """Find Promotions by promotion_type."""
+        return db.session.scalars(select(cls).filter_by(promotion_type=promotion_type)).all()
+
+    @classmethod
+    def duplicate_overrides(cls, data):
+        """Validate and convert the override fields of a duplicate request"""
+        if not isinstance(data, dict):
+            raise DataValidationError("Invalid input data type: overrides must be a JSON object")
+        try:
+            overrides = {
+                name: convert(data[name]) for name, convert in DUPLICATE_CONVERTERS.items() if name in data
+            }
+        except (ValueError, TypeError) as error:
+            raise DataValidationError(f"Invalid field value: {error}") from error
+        # An empty name or start date means "derive it from the original"
+        for name in ("product_name", "start_date"):
+            if not overrides.get(name):
+                overrides.pop(name, None)
+        return overrides
+
+    @classmethod
+    def duplicate_statement(cls, criteria, overrides):
+        """Build the INSERT ... SELECT that copies the promotions matching criteria"""
+        # Copy every column from the original row unless it is overridden;
+        # the name is made unique by appending a copy number when not overridden
+        derived = {
+            "product_name": cls.product_name + f"_copy_{next(COPY_NUMBERS)}",
+            "start_date": func.coalesce(cls.start_date, datetime.now()),
+        }
+        source = []
+        for name in DUPLICATE_COLUMNS:
+            column = getattr(cls, name)
+            if name in overrides:
+                source.append(cast(overrides[name], column.type))
+            else:
+                source.append(derived.get(name, column))
+
+        return (
+            insert(cls)
+            .from_select(DUPLICATE_COLUMNS, select(*source).where(criteria))
+            .returning(cls)
+        )
 
     @classmethod
     def duplicate_promotion(cls, original_id, override_data=None):
-        """Duplicate a promotion with optional overrides and proper error handling"""
+        """Duplicate a promotion server-side with a single INSERT ... SELECT"""
         from flask import request  # pylint: disable=import-outside-toplevel
 
-        # Find the original promotion
-        original_promotion = cls.find(original_id)
-        if not original_promotion:
-            raise DataValidationError(f"Promotion with ID {original_id} not found")
-
         # Get override data from request if not provided
         if override_data is None:
             override_data = request.get_json() or {}
-        # Create new promotion data by copying from original and applying overrides
-        # Handle product_name - if not overridden, make it unique by appending timestamp
-        product_name_override = override_data.get("product_name")
-        if product_name_override:
-            new_product_name = product_name_override
-        else:
-            # Make the product name unique by appending timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            new_product_name = f"{original_promotion.product_name}_copy_{timestamp}"
-
-        new_promotion_data = {
-            "product_name": new_product_name,
-            "description": override_data.get("description", original_promotion.description),
-            "original_price": override_data.get("original_price", float(original_promotion.original_price)),
-            "discount_value": override_data.get(
-                "discount_value",
-                (float(original_promotion.discount_value) if original_promotion.discount_value else None),
-            ),
-            "discount_type": override_data.get(
-                "discount_type",
-                (original_promotion.discount_type.value if original_promotion.discount_type else None),
-            ),
-            "promotion_type": override_data.get("promotion_type", original_promotion.promotion_type.value),
-            "expiration_date": override_data.get("expiration_date", original_promotion.expiration_date.isoformat()),
-            "status": override_data.get(
-                "status",
-                (original_promotion.status.value if original_promotion.status else None),
-            ),
-        }
-
-        # Only add start_date if it exists in original or override
-        start_date_override = override_data.get("start_date")
-        if start_date_override:
-            new_promotion_data["start_date"] = start_date_override
-        elif original_promotion.start_date:
-            new_promotion_data["start_date"] = original_promotion.start_date.isoformat()
+        overrides = cls.duplicate_overrides(override_data)
 
-        # Create the new promotion using deserialize
-        logger.info("Creating promotion with data: %s", new_promotion_data)
-        new_promotion = cls()
-        new_promotion.deserialize(new_promotion_data)
-        new_promotion.create()
+        stmt = cls.duplicate_statement(cls.id == original_id, overrides)
+        logger.info("Duplicating promotion %s with overrides: %s", original_id, overrides)
+        try:
+            new_promotion = db.session.scalars(stmt).first()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error duplicating record: %s", original_id)
+            raise DataValidationError(e) from e
 
+        if new_promotion is None:
+            raise DataValidationError(f"Promotion with ID {original_id} not found")
         return new_promotion
 
+    @classmethod
+    def duplicate_promotions(cls, original_ids, override_data=None):
+        """Duplicate several promotions with one INSERT ... SELECT, all or nothing"""
+        overrides = cls.duplicate_overrides(override_data or {})
+        original_ids = sorted(set(original_ids))
+        # Every copy would get the same name and the unique index would reject all of them
+        if "product_name" in overrides and len(original_ids) > 1:
+            raise DataValidationError("product_name can only be overridden when copying a single promotion")
+
+        stmt = cls.duplicate_statement(cls.id.in_(original_ids), overrides)
+        logger.info("Duplicating promotions %s with overrides: %s", original_ids, overrides)
+        try:
+            new_promotions = db.session.scalars(stmt).all()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error duplicating records: %s", original_ids)
+            raise DataValidationError(e) from e
+
+        # Nothing is kept unless every requested promotion was copied
+        if len(new_promotions) != len(original_ids):
+            db.session.rollback()
+            found = set(db.session.scalars(select(cls.id).where(cls.id.in_(original_ids))))
+            missing = [original_id for original_id in original_ids if original_id not in found]
+            raise DataValidationError(f"Promotions with IDs {missing} not found")
+        db.session.commit()
+        return new_promotions
+
     @classmethod
     def create_promotion_with_error_handling(cls, data):
         """Create a promotion with comprehensive error handling and HTTP status classification"""
@@ -328,6 +560,16 @@ class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes
             status_code, error_type = cls.classify_duplicate_error(err)
             return None, status_code, error_type, str(err)
 
+    @classmethod
+    def duplicate_promotions_with_error_handling(cls, original_ids, override_data=None):
+        """Duplicate several promotions, returning error info instead of raising"""
+        try:
+            promotions = cls.duplicate_promotions(original_ids, override_data)
+            return promotions, None, None, None  # success, no error
+        except DataValidationError as err:
+            status_code, error_type = cls.classify_duplicate_error(err)
+            return None, status_code, error_type, str(err)
+
     @staticmethod
     def classify_validation_error(error):
         """Classify DataValidationError from create/update operations into appropriate HTTP status codes"""
@@ -375,3 +617,96 @@ class Promotion(db.Model):  # pylint: disable=too-many-instance-attributes
 
         # Handle other validation errors (400)
         return 400, "Bad Request"
+
+
+# Every field serialize_row() produces, i.e. what a list request may project
+SERIALIZED_FIELDS = frozenset(Promotion.__table__.columns.keys()) | frozenset(DERIVED_FIELD_COLUMNS)
+
+
+# Replicas start together; this lets one of them apply schema DDL at a time
+SCHEMA_LOCK = text("SELECT pg_advisory_xact_lock(hashtext('promotions_schema'))")
+
+# One row counting the statements that changed promotions; see create_version_trigger()
+promotions_version = db.Table(
+    "promotions_version",
+    db.Column("version", db.BigInteger, nullable=False, server_default="0"),
+)
+
+VERSION_TRIGGER_DDL = """
+CREATE OR REPLACE FUNCTION promotions_bump_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE promotions_version SET version = version + 1;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER promotions_bump_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON promotions
+    FOR EACH STATEMENT EXECUTE FUNCTION promotions_bump_version();
+"""
+
+
+@event.listens_for(db.metadata, "after_create")
+def create_version_trigger(target, connection, **kw):  # pylint: disable=unused-argument
+    """Seed promotions_version and install the trigger that bumps it on every write
+
+    The counter is bumped inside the writing transaction and its row stays
+    locked until that commits, so a reader only sees a version once the
+    change it counts is visible too. Concurrent writers to promotions queue
+    on that row for the rest of their transaction. Runs after every
+    create_all(), and only changes what is missing.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(SCHEMA_LOCK)
+    connection.execute(
+        text("INSERT INTO promotions_version (version) SELECT 0 WHERE NOT EXISTS (SELECT FROM promotions_version)")
+    )
+    installed = connection.execute(
+        text("SELECT 1 FROM pg_trigger WHERE tgname = 'promotions_bump_version' AND tgrelid = 'promotions'::regclass")
+    ).scalar()
+    if not installed:
+        connection.execute(text(VERSION_TRIGGER_DDL))
+
+
+@event.listens_for(Promotion.__table__, "after_create")
+def create_trigram_indexes(target, connection, **kw):  # pylint: disable=unused-argument
+    """Back the keyword search with pg_trgm GIN indexes when the extension is available"""
+    if connection.dialect.name != "postgresql":
+        return
+    available = connection.execute(
+        text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not available:
+        logger.warning("pg_trgm is not available; keyword search will not be indexed")
+        return
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for column in TRIGRAM_COLUMNS:
+        connection.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_promotions_{column}_trgm "
+                f"ON {target.name} USING gin ({column} gin_trgm_ops)"
+            )
+        )
+
+
+def upgrade_indexes(connection):
+    """Bring the indexes of an existing promotions table in line with the model
+
+    create_all() skips a table that already exists, so indexes added to (or
+    dropped from) __table_args__ would otherwise only reach new databases.
+    create_app() runs this on each start. Only the missing indexes are
+    created, since CREATE INDEX locks out writes even when the index exists.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(SCHEMA_LOCK)
+    table = Promotion.__table__
+    existing = {index["name"] for index in inspect(connection).get_indexes(table.name)}
+    for name in OBSOLETE_INDEXES:
+        if name in existing:
+            connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    for index in table.indexes:
+        if index.name not in existing:
+            connection.execute(CreateIndex(index, if_not_exists=True))
+    if any(f"ix_promotions_{column}_trgm" not in existing for column in TRIGRAM_COLUMNS):
+        create_trigram_indexes(table, connection)
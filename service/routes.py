@@ -14,20 +14,67 @@ POST /promotions - creates a new Promotions record in the database
 PUT /promotions/{id} - updates a Promotions record in the database
 DELETE /promotions/{id} - deletes a Promotions record in the database
 POST /promotions/{id} - duplicates a Promotions record in the database
+POST /promotions/duplicate?ids={id},{id} - duplicates many Promotions records at once
 """
 
+import hashlib
 import logging
+import re
+import threading
 from datetime import datetime
-from flask import jsonify, request
+from functools import lru_cache, partial, wraps
+from urllib.parse import urlencode
+import orjson
+from cachetools import LRUCache
+from flask import Response, request, stream_with_context
 from flask import current_app as app
 from flask_restx import Resource, Api, fields
+from flask_restx.utils import unpack
+from sqlalchemy import delete, select
 from werkzeug.exceptions import NotFound, BadRequest, MethodNotAllowed, UnsupportedMediaType, InternalServerError
-from service.models import Promotion, StatusEnum, db, DiscountTypeEnum, PromotionTypeEnum
+from service.models import Promotion, StatusEnum, db, DiscountTypeEnum, PromotionTypeEnum, SERIALIZED_FIELDS
 from service.common import status
+from service.common.json_response import json_response
+from service.common.msgpack_response import MSGPACK_MIMETYPE, msgpack_response
 
 
 logger = logging.getLogger("flask.app")
 
+# Number of rows fetched per round-trip when streaming unbounded lists
+STREAM_BATCH_SIZE = 500
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Status criteria shared by every list request, built once at import
+ACTIVE = Promotion.status == StatusEnum.active
+ACTIVE_OR_EXPIRED = Promotion.status.in_((StatusEnum.active, StatusEnum.expired))
+
+# Which promotions each role may list (None means no restriction)
+ROLE_CRITERIA = {
+    "customer": ACTIVE,
+    "supplier": ACTIVE_OR_EXPIRED,
+    "manager": None,
+}
+
+# Constant body of the health probe, serialized once at import
+HEALTH_BODY = orjson.dumps({"status": "OK"})
+
+# ISO 8601 dates and datetimes accepted by the start_date/end_date list filters
+ISO_DATETIME = re.compile(
+    r"\d{4}-\d{2}-\d{2}([T ]\d{2}(:\d{2}(:\d{2}(\.\d{1,6})?)?)?(Z|[+-]\d{2}(:?\d{2})?)?)?"
+)
+
+# Most promotions one batch duplicate request may copy
+MAX_BATCH_DUPLICATE = 500
+
+# Latest ETag of each list (query string and representation) and the table version it was rendered at
+LIST_ETAGS = LRUCache(maxsize=1024)
+LIST_ETAGS_LOCK = threading.Lock()
+
+# Keyset pagination defaults for the list endpoint
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+PAGE_ARGS = ("cursor", "limit", "offset", "page", "per_page")
+
 
 ######################################################################
 # Helper Functions
@@ -37,6 +84,323 @@ def error_response(error: str, message: str, code: int):
     return {"error": error, "message": message}, code
 
 
+def escape_like(value: str):
+    """Escape the LIKE wildcards in a user-supplied search term."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def prebuilt_error(error: str, message: str, code: int):
+    """Encode a constant error body once, for use with prebuilt_response()."""
+    return orjson.dumps({"error": error, "message": message}), code
+
+
+def no_content():
+    """Return an empty 204 response without going through the JSON representation."""
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+def prebuilt_response(prebuilt):
+    """Return a Response for an error body encoded by prebuilt_error()."""
+    body, code = prebuilt
+    return Response(body, status=code, mimetype="application/json")
+
+
+# Error bodies whose text never changes, encoded once at import
+INVALID_PAGINATION = prebuilt_error("Bad Request", "Invalid pagination parameters", status.HTTP_400_BAD_REQUEST)
+INVALID_ROLE = prebuilt_error("Bad Request", "Invalid role value", status.HTTP_400_BAD_REQUEST)
+INVALID_FIELDS = prebuilt_error("Bad Request", "Invalid fields value", status.HTTP_400_BAD_REQUEST)
+INVALID_IDS = prebuilt_error("Bad Request", "Invalid ids value", status.HTTP_400_BAD_REQUEST)
+TOO_MANY_IDS = prebuilt_error(
+    "Bad Request", f"At most {MAX_BATCH_DUPLICATE} promotions can be duplicated at once", status.HTTP_400_BAD_REQUEST
+)
+INVALID_DATE = prebuilt_error("Bad Request", "Invalid date format", status.HTTP_400_BAD_REQUEST)
+UNSUPPORTED_MEDIA_TYPE = prebuilt_error(
+    "Unsupported Media Type",
+    "Content-Type must be application/json",
+    status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+)
+ACTIVE_DELETE_CONFLICT = prebuilt_error("Conflict", "Cannot delete active promotion", status.HTTP_409_CONFLICT)
+AUTHENTICATION_REQUIRED = prebuilt_error("Unauthorized", "Authentication required", status.HTTP_401_UNAUTHORIZED)
+ADMIN_REQUIRED = prebuilt_error(
+    "Forbidden",
+    "Administrator privileges required to duplicate promotions",
+    status.HTTP_403_FORBIDDEN,
+)
+
+
+def negotiated_mimetype(*extra):
+    """Return the media type the response is encoded in, chosen as RESTX chooses it
+
+    extra lists the types a view renders itself, next to the API's representations.
+    """
+    return request.accept_mimetypes.best_match([*api.representations, *extra], default=api.default_mediatype)
+
+
+def digest(data: bytes):
+    """Return the short hash ETags are made of."""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def promotion_etag(updated_at):
+    """Return the ETag of one promotion's representation, derived from its updated_at."""
+    return digest(f"{updated_at.isoformat()}|{negotiated_mimetype()}".encode())
+
+
+def row_etagged(view):
+    """Tag a promotion with an ETag derived from its updated_at, and answer
+    If-None-Match with 304 after reading only that column.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.if_none_match:
+            updated_at = Promotion.find_updated_at(kwargs["promotion_id"])
+            if updated_at is not None and request.if_none_match.contains(promotion_etag(updated_at)):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+                response.set_etag(promotion_etag(updated_at))
+                response.vary.add("Accept")
+                return response
+        data, code, headers = unpack(view(*args, **kwargs))
+        response = api.make_response(data, code, headers)
+        if code == status.HTTP_200_OK:
+            response.set_etag(promotion_etag(data["updated_at"]))
+            response.vary.add("Accept")
+        return response
+
+    return wrapper
+
+
+def list_etagged(view):
+    """Tag a list with an ETag and answer a matching If-None-Match with 304.
+
+    The ETag hashes the encoded body, so it always matches what was sent. A
+    streamed list is hashed from the table version read before its rows are.
+    Each ETag is remembered with the table version it was rendered at, and a
+    revalidation whose version is unchanged gets its 304 without querying or
+    serializing the list. The version is read for revalidations and streamed
+    lists only; a trigger bumps it with every commit that writes to the table,
+    whichever process, session or client makes the write.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.full_path, negotiated_mimetype(NDJSON_MIMETYPE))
+        version = None
+        if request.if_none_match:
+            version = Promotion.table_version()
+            with LIST_ETAGS_LOCK:
+                remembered = LIST_ETAGS.get(key)
+            if remembered is not None and remembered[0] == version and request.if_none_match.contains(remembered[1]):
+                return list_headers(Response(status=status.HTTP_304_NOT_MODIFIED), remembered[1])
+
+        result = view(*args, **kwargs)
+        response = result if isinstance(result, Response) else api.make_response(*unpack(result))
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        if response.is_streamed:
+            # The stream reads its rows only as it is sent, after this version
+            if version is None:
+                version = Promotion.table_version()
+            etag = digest(repr((version, key)).encode())
+        else:
+            etag = digest(response.get_data())
+        if version is not None:
+            with LIST_ETAGS_LOCK:
+                LIST_ETAGS[key] = (version, etag)
+
+        if request.if_none_match.contains(etag):
+            response.close()
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        return list_headers(response, etag)
+
+    return wrapper
+
+
+def list_headers(response, etag):
+    """Set the ETag and caching headers of a list response."""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.max_age = app.config["LIST_MAX_AGE"]
+    response.vary.add("Accept")
+    return response
+
+
+def keep_loaded(view):
+    """Keep what a write endpoint saves loaded through its commit, for serializing it
+
+    INSERT and UPDATE ... RETURNING already brought back every column, so the
+    serialize() after the commit needs no re-SELECT. Everything else still
+    expires on commit, and the objects are expired once the view returns, so
+    nothing loaded here is served stale by a later find().
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        session = db.session()
+        session.expire_on_commit = False
+        try:
+            return view(*args, **kwargs)
+        finally:
+            session.expire_on_commit = True
+            session.expire_all()
+
+    return wrapper
+
+
+@lru_cache(maxsize=16)
+def location_prefix(url_root: str):  # pylint: disable=unused-argument
+    """Build the external promotion URL up to the id once per url_root."""
+    return api.url_for(PromotionResource, promotion_id=0, _external=True).rsplit("/", 1)[0]
+
+
+def promotion_location(promotion_id: int):
+    """Return the external URL of a promotion without walking the URL map."""
+    return f"{location_prefix(request.url_root)}/{promotion_id}"
+
+
+def check_duplicate_request():
+    """Return the error response for a duplicate request that is not an administrator's JSON POST."""
+    # -------- Authentication --------
+    role = request.headers.get("X-Role")
+    if not role:
+        return prebuilt_response(AUTHENTICATION_REQUIRED)
+
+    if role.lower() != "administrator":
+        return prebuilt_response(ADMIN_REQUIRED)
+
+    # -------- Content-Type --------
+    if not request.is_json:
+        return prebuilt_response(UNSUPPORTED_MEDIA_TYPE)
+    return None
+
+
+# Paginated and polled lists repeat the same date arguments request after request
+@lru_cache(maxsize=1024)
+def parse_date_arg(value: str):
+    """Parse an ISO 8601 query argument, returning None when it is not a valid date."""
+    # Reject obvious garbage with the regex before paying for a raised exception
+    if not ISO_DATETIME.fullmatch(value):
+        return None
+    try:
+        # fromisoformat is C-implemented and accepts a trailing "Z" on 3.11+
+        return datetime.fromisoformat(value)
+    except ValueError:  # e.g. 2025-02-30, which the regex cannot rule out
+        return None
+
+
+def parse_page_args(args):
+    """Parse the pagination arguments, raising ValueError when invalid.
+
+    per_page is an alias of limit, and page selects offset (page - 1) * limit.
+    """
+    cursor = int(args["cursor"]) if args.get("cursor") else None
+    limit = args.get("limit") or args.get("per_page")
+    limit = int(limit) if limit else DEFAULT_PAGE_LIMIT
+    page = int(args["page"]) if args.get("page") else 1
+    if limit < 1 or page < 1:
+        raise ValueError("limit and page must be positive")
+    limit = min(limit, MAX_PAGE_LIMIT)
+    offset = int(args["offset"]) if args.get("offset") else (page - 1) * limit
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+    return cursor, limit, offset
+
+
+def project_fields(stmt, field_list: str):
+    """Restrict a list statement to the requested fields, raising ValueError for unknown ones.
+
+    Returns the narrowed statement and the function that serializes its rows.
+    """
+    names = field_list.split(",")
+    if not SERIALIZED_FIELDS.issuperset(names):
+        raise ValueError("unknown field")
+    stmt = stmt.with_only_columns(*Promotion.projection(names))
+    return stmt, partial(Promotion.serialize_fields, fields=names)
+
+
+def paginate_promotions(stmt, serialize, cursor, limit, offset=0):
+    """Return one page of promotions ordered by id, after the cursor and/or offset."""
+    if cursor is not None:
+        stmt = stmt.where(Promotion.id > cursor)
+    rows = db.session.execute(stmt.order_by(Promotion.id).offset(offset).limit(limit)).all()
+    next_cursor = rows[-1].id if len(rows) == limit else None
+    body = {"items": [serialize(row) for row in rows], "next_cursor": next_cursor}
+    links = page_links(cursor, limit, offset, next_cursor)
+    return body, status.HTTP_200_OK, {"Link": links} if links else {}
+
+
+def page_links(cursor, limit, offset, next_cursor):
+    """Build the Link header value pointing at the next and previous pages."""
+    args = {key: value for key, value in request.args.items() if key not in PAGE_ARGS}
+    links = []
+    if next_cursor is not None:
+        following = {"cursor": next_cursor} if cursor is not None else {"offset": offset + limit}
+        links.append(f'<{request.base_url}?{urlencode({**args, **following, "limit": limit})}>; rel="next"')
+    if cursor is None and offset:
+        preceding = {"offset": max(offset - limit, 0), "limit": limit}
+        links.append(f'<{request.base_url}?{urlencode({**args, **preceding})}>; rel="prev"')
+    return ", ".join(links)
+
+
+def stream_promotions(stmt, serialize):
+    """Stream the promotions of a statement as a JSON array, fetching rows in batches."""
+
+    def generate():
+        rows = db.session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        yield b"["
+        for position, row in enumerate(rows):
+            if position:
+                yield b","
+            yield orjson.dumps(serialize(row))
+        yield b"]"
+
+    return Response(
+        stream_with_context(generate()),
+        status=status.HTTP_200_OK,
+        mimetype="application/json",
+    )
+
+
+def stream_promotions_ndjson(stmt, serialize):
+    """Stream the promotions of a statement as newline-delimited JSON, one row per line."""
+
+    def generate():
+        rows = db.session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        for row in rows:
+            yield orjson.dumps(serialize(row), option=orjson.OPT_APPEND_NEWLINE)
+
+    return Response(
+        stream_with_context(generate()),
+        status=status.HTTP_200_OK,
+        mimetype=NDJSON_MIMETYPE,
+    )
+
+
+def list_response(stmt, role, serialize=Promotion.serialize_row):
+    """Build the list response: a keyset page, a streamed array or NDJSON, or a plain list."""
+    if any(arg in request.args for arg in PAGE_ARGS):
+        try:
+            page_args = parse_page_args(request.args)
+        except ValueError:
+            return prebuilt_response(INVALID_PAGINATION)
+        return paginate_promotions(stmt, serialize, *page_args)
+
+    # Listed in id order, which the (status, id) index delivers without a sort
+    stmt = stmt.order_by(Promotion.id)
+    mimetype = negotiated_mimetype(NDJSON_MIMETYPE)
+    if mimetype == NDJSON_MIMETYPE:
+        return stream_promotions_ndjson(stmt, serialize)
+
+    # Managers see the whole table, so stream it instead of materializing it
+    # (MessagePack arrays need their length up front, so those are built whole)
+    if role == "manager" and mimetype != MSGPACK_MIMETYPE:
+        return stream_promotions(stmt, serialize)
+
+    # Plain column rows skip ORM instance construction for every listed promotion
+    results = [serialize(row) for row in db.session.execute(stmt)]
+    return results, status.HTTP_200_OK
+
+
 ######################################################################
 # Swagger & RESTX API Initialization
 ######################################################################
@@ -57,6 +421,19 @@ api = Api(
     default_label="Promotions API operations"
 )
 
+
+@api.representation("application/json")
+def output_json(data, code, headers=None):
+    """Encode every RESTX response body with orjson"""
+    return json_response(data, code, headers)
+
+
+@api.representation(MSGPACK_MIMETYPE)
+def output_msgpack(data, code, headers=None):
+    """Encode RESTX response bodies as MessagePack for clients that accept it"""
+    return msgpack_response(data, code, headers)
+
+
 promotion_create_model = api.model(
     "Promotion",
     {
@@ -133,44 +510,25 @@ class PromotionCollection(Resource):
     """Handles operations on the promotions collection."""
 
     @api.doc("list_promotions")
+    @list_etagged
     def get(self):
         """List promotions with filtering by role, keyword, and date."""
-        # -------- Auto-expire promotions --------
-        expired = Promotion.query.filter(
-            Promotion.expiration_date < datetime.now(),
-            Promotion.status == StatusEnum.active,
-        ).all()
-
-        for pro in expired:
-            pro.status = StatusEnum.expired
-            pro.update()
-
         # -------- Role filter --------
         role = request.args.get("role", "customer").lower()
-        if role == "customer":
-            query = Promotion.query.filter(
-                Promotion.status == StatusEnum.active
-            )
-        elif role == "supplier":
-            query = Promotion.query.filter(
-                Promotion.status.in_([StatusEnum.active, StatusEnum.expired])
-            )
-        elif role == "manager":
-            query = Promotion.query
-        else:
-            return error_response(
-                "Bad Request",
-                "Invalid role value",
-                status.HTTP_400_BAD_REQUEST,
-            )
+        if role not in ROLE_CRITERIA:
+            return prebuilt_response(INVALID_ROLE)
+        stmt = select(Promotion.__table__)
+        if ROLE_CRITERIA[role] is not None:
+            stmt = stmt.where(ROLE_CRITERIA[role])
 
         # -------- Keyword filter --------
         keyword = request.args.get("q") or request.args.get("keyword")
         if keyword:
-            like_expr = f"%{keyword}%"
-            query = query.filter(
-                Promotion.product_name.ilike(like_expr)
-                | Promotion.description.ilike(like_expr)
+            # Served by the pg_trgm GIN indexes; wildcards in the keyword are matched literally
+            like_expr = f"%{escape_like(keyword)}%"
+            stmt = stmt.where(
+                Promotion.product_name.ilike(like_expr, escape="\\")
+                | Promotion.description.ilike(like_expr, escape="\\")
             )
 
         # -------- Date filter --------
@@ -178,37 +536,33 @@ class PromotionCollection(Resource):
         end_date_str = request.args.get("end_date")
 
         if start_date_str and end_date_str:
+            start_date = parse_date_arg(start_date_str)
+            end_date = parse_date_arg(end_date_str)
+            if start_date is None or end_date is None:
+                return prebuilt_response(INVALID_DATE)
+            stmt = stmt.where(
+                Promotion.start_date >= start_date,
+                Promotion.expiration_date <= end_date,
+            )
+
+        # -------- Field projection --------
+        field_list = request.args.get("fields")
+        if field_list:
             try:
-                start_date = datetime.fromisoformat(
-                    start_date_str.replace("Z", "+00:00")
-                )
-                end_date = datetime.fromisoformat(
-                    end_date_str.replace("Z", "+00:00")
-                )
-                query = query.filter(
-                    Promotion.start_date >= start_date,
-                    Promotion.expiration_date <= end_date,
-                )
+                stmt, serialize = project_fields(stmt, field_list)
             except ValueError:
-                return error_response(
-                    "Bad Request",
-                    "Invalid date format",
-                    status.HTTP_400_BAD_REQUEST,
-                )
+                return prebuilt_response(INVALID_FIELDS)
+            return list_response(stmt, role, serialize)
 
-        results = [p.serialize() for p in query.all()]
-        return results, status.HTTP_200_OK
+        return list_response(stmt, role)
 
     @api.doc("create_promotion")
     @api.expect(promotion_create_model)
+    @keep_loaded
     def post(self):
         """Create a new promotion."""
         if not request.is_json:
-            return error_response(
-                "Unsupported Media Type",
-                "Content-Type must be application/json",
-                status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            )
+            return prebuilt_response(UNSUPPORTED_MEDIA_TYPE)
 
         promotion, error_code, error_type, error_message = (
             Promotion.create_promotion_with_error_handling(
@@ -219,14 +573,10 @@ class PromotionCollection(Resource):
         if error_code:
             return error_response(error_type, error_message, error_code)
 
-        location_url = api.url_for(
-            PromotionResource, promotion_id=promotion.id, _external=True
-        )
-
         return (
             promotion.serialize(),
             status.HTTP_201_CREATED,
-            {"Location": location_url},
+            {"Location": promotion_location(promotion.id)},
         )
 
 
@@ -239,6 +589,7 @@ class PromotionResource(Resource):
     """Handles CRUD operations on a specific promotion."""
 
     @api.doc("get_promotion")
+    @row_etagged
     def get(self, promotion_id):
         """Retrieve a promotion by ID."""
         promotion = Promotion.find(promotion_id)
@@ -252,14 +603,11 @@ class PromotionResource(Resource):
 
     @api.doc("update_promotion")
     @api.expect(promotion_create_model)
+    @keep_loaded
     def put(self, promotion_id):
         """Update an existing promotion."""
         if not request.is_json:
-            return error_response(
-                "Unsupported Media Type",
-                "Content-Type must be application/json",
-                status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            )
+            return prebuilt_response(UNSUPPORTED_MEDIA_TYPE)
 
         promotion, error_code, error_type, error_message = (
             Promotion.update_promotion_with_error_handling(
@@ -278,17 +626,13 @@ class PromotionResource(Resource):
         promotion = Promotion.find(promotion_id)
 
         if not promotion:
-            return "", status.HTTP_204_NO_CONTENT
+            return no_content()
 
         if promotion.status == StatusEnum.active:
-            return error_response(
-                "Conflict",
-                "Cannot delete active promotion",
-                status.HTTP_409_CONFLICT,
-            )
+            return prebuilt_response(ACTIVE_DELETE_CONFLICT)
 
         promotion.delete()
-        return "", status.HTTP_204_NO_CONTENT
+        return no_content()
 
 
 ######################################################################
@@ -299,31 +643,12 @@ class PromotionDuplicate(Resource):
     """Duplicate an existing promotion with optional overrides."""
 
     @api.doc("duplicate_promotion")
+    @keep_loaded
     def post(self, promotion_id):
         """Duplicate a promotion after data validation."""
-        # -------- Authentication --------
-        role = request.headers.get("X-Role")
-        if not role:
-            return error_response(
-                "Unauthorized",
-                "Authentication required",
-                status.HTTP_401_UNAUTHORIZED,
-            )
-
-        if role.lower() != "administrator":
-            return error_response(
-                "Forbidden",
-                "Administrator privileges required to duplicate promotions",
-                status.HTTP_403_FORBIDDEN,
-            )
-
-        # -------- Content-Type --------
-        if not request.is_json:
-            return error_response(
-                "Unsupported Media Type",
-                "Content-Type must be application/json",
-                status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            )
+        rejection = check_duplicate_request()
+        if rejection:
+            return rejection
 
         # -------- Duplicate --------
         new_promotion, error_code, error_type, error_message = (
@@ -334,19 +659,43 @@ class PromotionDuplicate(Resource):
         if error_code:
             return error_response(error_type, error_message, error_code)
 
-        location_url = api.url_for(
-            PromotionResource,
-            promotion_id=new_promotion.id,
-            _external=True,
-        )
-
         return (
             new_promotion.serialize(),
             status.HTTP_201_CREATED,
-            {"Location": location_url},
+            {"Location": promotion_location(new_promotion.id)},
         )
 
 
+@api.route("/promotions/duplicate")
+class PromotionBatchDuplicate(Resource):
+    """Duplicate many promotions in one request."""
+
+    @api.doc("duplicate_promotions", params={"ids": "Comma-separated ids of the promotions to copy"})
+    @keep_loaded
+    def post(self):
+        """Duplicate every promotion in ?ids= with the same optional overrides."""
+        rejection = check_duplicate_request()
+        if rejection:
+            return rejection
+
+        try:
+            promotion_ids = [int(value) for value in request.args["ids"].split(",")]
+        except (KeyError, ValueError):
+            return prebuilt_response(INVALID_IDS)
+        if len(promotion_ids) > MAX_BATCH_DUPLICATE:
+            return prebuilt_response(TOO_MANY_IDS)
+
+        new_promotions, error_code, error_type, error_message = (
+            Promotion.duplicate_promotions_with_error_handling(
+                promotion_ids, request.get_json())
+        )
+
+        if error_code:
+            return error_response(error_type, error_message, error_code)
+
+        return [promotion.serialize() for promotion in new_promotions], status.HTTP_201_CREATED
+
+
 ######################################################################
 # Reset Database (BDD Test Helper)
 ######################################################################
@@ -357,9 +706,9 @@ class PromotionReset(Resource):
     @api.doc("reset_promotions")
     def delete(self):
         """Delete all promotions in the database."""
-        Promotion.query.delete()
+        db.session.execute(delete(Promotion))
         db.session.commit()
-        return "", status.HTTP_204_NO_CONTENT
+        return no_content()
 
 
 ######################################################################
@@ -369,4 +718,4 @@ class PromotionReset(Resource):
 @app.route("/health")
 def health():
     """Plain health check used by Kubernetes probes."""
-    return jsonify(status="OK"), status.HTTP_200_OK
+    return Response(HEALTH_BODY, status=status.HTTP_200_OK, mimetype="application/json")
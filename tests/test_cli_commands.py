@@ -26,7 +26,7 @@ from click.testing import CliRunner
 
 # pylint: disable=unused-import
 from wsgi import app  # noqa: F401
-from service.common.cli_commands import db_create, db_drop
+from service.common.cli_commands import db_create, db_drop, expire_promotions
 
 
 class TestFlaskCLI(TestCase):
@@ -53,3 +53,13 @@ class TestFlaskCLI(TestCase):
             result = self.runner.invoke(db_drop)
             self.assertEqual(result.exit_code, 0)
             db_mock.drop_all.assert_called_once()
+
+    @patch("service.common.cli_commands.Promotion")
+    def test_expire_promotions(self, promotion_mock):
+        """It should expire overdue promotions once"""
+        promotion_mock.expire_overdue.return_value = 3
+        with patch.dict(os.environ, {"FLASK_APP": "wsgi:app"}, clear=True):
+            result = self.runner.invoke(expire_promotions)
+            self.assertEqual(result.exit_code, 0)
+            promotion_mock.expire_overdue.assert_called_once_with()
+            self.assertIn("Expired 3 promotions", result.output)
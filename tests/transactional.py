@@ -0,0 +1,103 @@
+"""
+Per-test transaction isolation
+
+Every test runs inside one outer transaction on a single connection that is
+rolled back afterwards, instead of deleting and committing all rows before
+each test. The sessions used by the tests and by the app are bound to that
+connection with join_transaction_mode="create_savepoint", so their commit()
+and rollback() only release or roll back a SAVEPOINT.
+"""
+
+from contextlib import contextmanager
+from functools import cache
+from unittest import TestCase
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, inspect
+from service.models import db
+
+
+@cache
+def create_tables():
+    """Create the tables, keeping them from earlier runs unless they no longer match the models
+
+    The tests never commit, so tables left by an earlier run are empty; they
+    are only dropped when a column or index has been added to the models since.
+    Cached, so the schema is checked once per test run however many classes ask.
+    """
+    inspector = inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        if columns != set(table.columns.keys()) or not {index.name for index in table.indexes} <= indexes:
+            db.drop_all()
+            break
+    db.create_all()
+
+
+class SavepointSession(Session):  # pylint: disable=too-few-public-methods
+    """Session that always uses its own bind, ignoring the app's engines"""
+
+    def get_bind(self, *args, **kwargs):  # pylint: disable=arguments-differ,unused-argument
+        return self.bind
+
+
+class TransactionalTestCase(TestCase):
+    """TestCase that rolls back everything each test writes
+
+    Call begin_test_connection() once the tables exist and
+    end_test_connection() before dropping them.
+    """
+
+    connection = None
+    app_session = None
+    transaction = None
+
+    @classmethod
+    def begin_test_connection(cls):
+        """Open the shared connection and bind db.session to it"""
+        cls.connection = db.engine.connect()
+        cls.app_session = db.session
+        db.session = db._make_scoped_session(  # pylint: disable=protected-access
+            {
+                "class_": SavepointSession,
+                "bind": cls.connection,
+                "join_transaction_mode": "create_savepoint",
+            }
+        )
+
+    @classmethod
+    def end_test_connection(cls):
+        """Restore the app's session and close the shared connection"""
+        db.session.remove()
+        db.session = cls.app_session
+        cls.connection.close()
+
+    def setUp(self):
+        """Begin the outer transaction of the test"""
+        self.transaction = self.connection.begin()
+
+    def tearDown(self):
+        """Throw away everything the test wrote"""
+        db.session.remove()
+        self.transaction.rollback()
+
+    @contextmanager
+    def assert_max_selects(self, limit):
+        """Fail if the block runs more than limit SELECTs on the test connection
+
+        SAVEPOINTs and other statements of the isolation itself are not counted.
+        """
+        selects = []
+
+        def count(conn, cursor, statement, *args):  # pylint: disable=unused-argument
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(self.connection, "before_cursor_execute", count)
+        try:
+            yield
+        finally:
+            event.remove(self.connection, "before_cursor_execute", count)
+        self.assertLessEqual(len(selects), limit, "\n".join(selects))